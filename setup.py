@@ -25,7 +25,9 @@ setuptools.setup(
     name="systemctl-mqtt",
     packages=setuptools.find_packages(),
     description="MQTT client triggering & reporting shutdown on systemd-based systems",
-    long_description=pathlib.Path(__file__).parent.joinpath("README.md").read_text(),
+    long_description=pathlib.Path(__file__)
+    .parent.joinpath("README.md")
+    .read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     author="Fabian Peter Hammerle",
     author_email="fabian@hammerle.me",
@@ -27,7 +27,6 @@ import os
 import pathlib
 import socket
 import ssl
-import threading
 import typing
 
 import aiomqtt
@@ -46,6 +45,11 @@ _MQTT_DEFAULT_TLS_PORT = 8883
 # https://web.archive.org/web/20250101075341/https://www.home-assistant.io/integrations/sensor.mqtt/#payload_not_available
 _MQTT_PAYLOAD_NOT_AVAILABLE = "offline"
 _MQTT_PAYLOAD_AVAILABLE = "online"
+# indexable by bool
+_MQTT_PAYLOAD_BOOL = (
+    systemctl_mqtt._mqtt.encode_bool(False),  # pylint: disable=protected-access
+    systemctl_mqtt._mqtt.encode_bool(True),  # pylint: disable=protected-access
+)
 _ARGUMENT_LOG_LEVEL_MAPPING = {
     a: getattr(logging, a.upper())
     for a in ("debug", "info", "warning", "error", "critical")
@@ -54,8 +58,28 @@ _ARGUMENT_LOG_LEVEL_MAPPING = {
 _LOGGER = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_package_metadata():
+    # return type importlib.metadata.PackageMetadata added in python3.10
+    # scans sys.path for *.dist-info
+    return importlib.metadata.metadata(__name__)
+
+
 class _State:
     # pylint: disable=too-many-instance-attributes
+    __slots__ = (
+        "_mqtt_topic_prefix",
+        "_preparing_for_shutdown_topic",
+        "_login_manager",
+        "_shutdown_lock",
+        "_last_published_preparing_for_shutdown",
+        "poweroff_delay",
+        "_monitored_system_unit_names",
+        "_mqtt_action_by_topic",
+        "_homeassistant_discovery_topic",
+        "_homeassistant_discovery_payload",
+    )
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         *,
@@ -66,15 +90,30 @@ class _State:
         monitored_system_unit_names: typing.List[str],
     ) -> None:
         self._mqtt_topic_prefix = mqtt_topic_prefix
-        self._homeassistant_discovery_prefix = homeassistant_discovery_prefix
-        self._homeassistant_discovery_object_id = homeassistant_discovery_object_id
+        self._preparing_for_shutdown_topic = (
+            f"{mqtt_topic_prefix}/preparing-for-shutdown"
+        )
         self._login_manager = (
             systemctl_mqtt._dbus.login_manager.get_login_manager_proxy()
         )
         self._shutdown_lock: typing.Optional[jeepney.fds.FileDescriptor] = None
-        self._shutdown_lock_mutex = threading.Lock()
+        self._last_published_preparing_for_shutdown: typing.Optional[bool] = None
         self.poweroff_delay = poweroff_delay
         self._monitored_system_unit_names = monitored_system_unit_names
+        self._mqtt_action_by_topic = {
+            f"{mqtt_topic_prefix}/{topic_suffix}": action
+            for topic_suffix, action in _MQTT_TOPIC_SUFFIX_ACTION_MAPPING.items()
+        }
+        # <discovery_prefix>/<component>/[<node_id>/]<object_id>/config
+        # https://www.home-assistant.io/integrations/mqtt/#mqtt-discovery
+        self._homeassistant_discovery_topic = (
+            f"{homeassistant_discovery_prefix}/device"
+            f"/{homeassistant_discovery_object_id}/config"
+        )
+        # inputs do not change during runtime => serialize once
+        self._homeassistant_discovery_payload = json.dumps(
+            self._get_homeassistant_device_config(), separators=(",", ":")
+        ).encode()
 
     @property
     def mqtt_topic_prefix(self) -> str:
@@ -86,10 +125,14 @@ class _State:
         # https://github.com/home-assistant/core/blob/2024.12.5/tests/components/mqtt/conftest.py#L23
         # > _MQTT_AVAILABILITY_TOPIC = "switchbot-mqtt/status"
         # https://github.com/fphammerle/switchbot-mqtt/blob/v3.3.1/switchbot_mqtt/__init__.py#L30
-        return self._mqtt_topic_prefix + "/status"
+        return f"{self._mqtt_topic_prefix}/status"
 
     def get_system_unit_active_state_mqtt_topic(self, *, unit_name: str) -> str:
-        return self._mqtt_topic_prefix + "/unit/system/" + unit_name + "/active-state"
+        return f"{self._mqtt_topic_prefix}/unit/system/{unit_name}/active-state"
+
+    @property
+    def mqtt_action_by_topic(self) -> typing.Dict[str, "_MQTTAction"]:
+        return self._mqtt_action_by_topic
 
     @property
     def monitored_system_unit_names(self) -> typing.List[str]:
@@ -100,55 +143,62 @@ class _State:
         return self._shutdown_lock is not None
 
     def acquire_shutdown_lock(self) -> None:
-        with self._shutdown_lock_mutex:
-            assert self._shutdown_lock is None
-            # https://www.freedesktop.org/wiki/Software/systemd/inhibit/
-            (self._shutdown_lock,) = self._login_manager.Inhibit(
-                what="shutdown",
-                who="systemctl-mqtt",
-                why="Report shutdown via MQTT",
-                mode="delay",
-            )
-            assert isinstance(
-                self._shutdown_lock, jeepney.fds.FileDescriptor
-            ), self._shutdown_lock
-            _LOGGER.debug("acquired shutdown inhibitor lock")
+        # no mutex required: only called from the event loop's thread
+        if self._shutdown_lock is not None:  # e.g., repeated PrepareForShutdown(false)
+            _LOGGER.debug("shutdown inhibitor lock already acquired")
+            return
+        # https://www.freedesktop.org/wiki/Software/systemd/inhibit/
+        (self._shutdown_lock,) = self._login_manager.Inhibit(
+            what="shutdown",
+            who="systemctl-mqtt",
+            why="Report shutdown via MQTT",
+            mode="delay",
+        )
+        assert isinstance(
+            self._shutdown_lock, jeepney.fds.FileDescriptor
+        ), self._shutdown_lock
+        _LOGGER.debug("acquired shutdown inhibitor lock")
 
     def release_shutdown_lock(self) -> None:
-        with self._shutdown_lock_mutex:
-            if self._shutdown_lock:
-                self._shutdown_lock.close()
-                _LOGGER.debug("released shutdown inhibitor lock")
-                self._shutdown_lock = None
-
-    @property
-    def _preparing_for_shutdown_topic(self) -> str:
-        return self.mqtt_topic_prefix + "/preparing-for-shutdown"
+        shutdown_lock, self._shutdown_lock = self._shutdown_lock, None
+        if shutdown_lock is not None:
+            shutdown_lock.close()
+            _LOGGER.debug("released shutdown inhibitor lock")
 
     async def _publish_preparing_for_shutdown(
         self, *, mqtt_client: aiomqtt.Client, active: bool
     ) -> None:
         topic = self._preparing_for_shutdown_topic
-        # pylint: disable=protected-access
-        payload = systemctl_mqtt._mqtt.encode_bool(active)
+        payload = _MQTT_PAYLOAD_BOOL[active]
+        if active == self._last_published_preparing_for_shutdown:
+            _LOGGER.debug("skipping repeated publish of %r on %s", payload, topic)
+            return
         _LOGGER.info("publishing %r on %s", payload, topic)
         await mqtt_client.publish(topic=topic, payload=payload, retain=False)
+        self._last_published_preparing_for_shutdown = active
 
     async def preparing_for_shutdown_handler(
         self, active: bool, mqtt_client: aiomqtt.Client
     ) -> None:
-        active = bool(active)
-        await self._publish_preparing_for_shutdown(
-            mqtt_client=mqtt_client, active=active
-        )
-        if active:
-            self.release_shutdown_lock()
-        else:
+        # signal's body of type "b" is decoded to bool by jeepney
+        try:
+            await self._publish_preparing_for_shutdown(
+                mqtt_client=mqtt_client, active=active
+            )
+        finally:  # e.g., aiomqtt.MqttError on publish timeout
+            if active:  # avoid delaying shutdown any further
+                self.release_shutdown_lock()
+        if not active:
             self.acquire_shutdown_lock()
 
-    async def publish_preparing_for_shutdown(self, mqtt_client: aiomqtt.Client) -> None:
+    async def publish_preparing_for_shutdown(
+        self,
+        *,
+        mqtt_client: aiomqtt.Client,
+        login_manager: jeepney.io.asyncio.Proxy,
+    ) -> None:
         try:
-            ((return_type, active),) = self._login_manager.Get("PreparingForShutdown")
+            ((return_type, active),) = await login_manager.Get("PreparingForShutdown")
         except jeepney.wrappers.DBusErrorResponse as exc:
             _LOGGER.error(
                 "failed to read logind's PreparingForShutdown property: %s", exc
@@ -160,25 +210,13 @@ class _State:
             mqtt_client=mqtt_client, active=active
         )
 
-    async def publish_homeassistant_device_config(
-        self, mqtt_client: aiomqtt.Client
-    ) -> None:
-        # <discovery_prefix>/<component>/[<node_id>/]<object_id>/config
-        # https://www.home-assistant.io/integrations/mqtt/#mqtt-discovery
-        discovery_topic = "/".join(
-            (
-                self._homeassistant_discovery_prefix,
-                "device",
-                self._homeassistant_discovery_object_id,
-                "config",
-            )
-        )
+    def _get_homeassistant_device_config(self) -> typing.Dict[str, typing.Any]:
         hostname = (
             # pylint: disable=protected-access; function in internal module
             systemctl_mqtt._utils.get_hostname()
         )
-        package_metadata = importlib.metadata.metadata(__name__)
-        unique_id_prefix = "systemctl-mqtt-" + hostname
+        package_metadata = _get_package_metadata()
+        unique_id_prefix = f"systemctl-mqtt-{hostname}"
         config = {
             "device": {"identifiers": [hostname], "name": hostname},
             "origin": {
@@ -189,31 +227,29 @@ class _State:
             "availability": {"topic": self.mqtt_availability_topic},
             "components": {
                 "logind/preparing-for-shutdown": {
-                    "unique_id": unique_id_prefix + "-logind-preparing-for-shutdown",
+                    "unique_id": f"{unique_id_prefix}-logind-preparing-for-shutdown",
                     "object_id": f"{hostname}_logind_preparing_for_shutdown",  # entity id
                     "name": "preparing for shutdown",  # home assistant prepends device name
                     "platform": "binary_sensor",
                     "state_topic": self._preparing_for_shutdown_topic,
-                    # pylint: disable=protected-access
-                    "payload_on": systemctl_mqtt._mqtt.encode_bool(True),
-                    "payload_off": systemctl_mqtt._mqtt.encode_bool(False),
+                    "payload_on": _MQTT_PAYLOAD_BOOL[True],
+                    "payload_off": _MQTT_PAYLOAD_BOOL[False],
                 },
             },
         }
         for mqtt_topic_suffix in _MQTT_TOPIC_SUFFIX_ACTION_MAPPING.keys():
             # false positive warning by mypy:
             # > Unsupported target for indexed assignment
-            config["components"]["logind/" + mqtt_topic_suffix] = {  # type: ignore
-                "unique_id": unique_id_prefix + "-logind-" + mqtt_topic_suffix,
-                "object_id": hostname
-                + "_logind_"
-                + mqtt_topic_suffix.replace("-", "_"),  # entity id
+            config["components"][f"logind/{mqtt_topic_suffix}"] = {  # type: ignore
+                "unique_id": f"{unique_id_prefix}-logind-{mqtt_topic_suffix}",
+                # entity id
+                "object_id": f"{hostname}_logind_{mqtt_topic_suffix.replace('-', '_')}",
                 "name": mqtt_topic_suffix.replace("-", " "),
                 "platform": "button",
-                "command_topic": self.mqtt_topic_prefix + "/" + mqtt_topic_suffix,
+                "command_topic": f"{self.mqtt_topic_prefix}/{mqtt_topic_suffix}",
             }
         for unit_name in self._monitored_system_unit_names:
-            config["components"]["unit/system/" + unit_name + "/active-state"] = {  # type: ignore
+            config["components"][f"unit/system/{unit_name}/active-state"] = {  # type: ignore
                 "unique_id": f"{unique_id_prefix}-unit-system-{unit_name}-active-state",
                 "object_id": f"{hostname}_unit_system_{unit_name}_active_state",
                 "name": f"{unit_name} active state",
@@ -222,23 +258,43 @@ class _State:
                     unit_name=unit_name
                 ),
             }
-        _LOGGER.debug("publishing home assistant config on %s", discovery_topic)
+        return config
+
+    async def publish_homeassistant_device_config(
+        self, mqtt_client: aiomqtt.Client
+    ) -> None:
+        _LOGGER.debug(
+            "publishing home assistant config on %s",
+            self._homeassistant_discovery_topic,
+        )
         await mqtt_client.publish(
-            topic=discovery_topic, payload=json.dumps(config), retain=False
+            topic=self._homeassistant_discovery_topic,
+            payload=self._homeassistant_discovery_payload,
+            retain=False,
         )
 
 
 class _MQTTAction(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
+    _name: str
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._name = cls.__name__
+
     @abc.abstractmethod
     def trigger(self, state: _State) -> None:
         pass  # pragma: no cover
 
     def __str__(self) -> str:
-        return type(self).__name__
+        return self._name
 
 
 class _MQTTActionSchedulePoweroff(_MQTTAction):
     # pylint: disable=too-few-public-methods
+    __slots__ = ()
+
     def trigger(self, state: _State) -> None:
         # pylint: disable=protected-access
         systemctl_mqtt._dbus.login_manager.schedule_shutdown(
@@ -248,6 +304,8 @@ class _MQTTActionSchedulePoweroff(_MQTTAction):
 
 class _MQTTActionLockAllSessions(_MQTTAction):
     # pylint: disable=too-few-public-methods
+    __slots__ = ()
+
     def trigger(self, state: _State) -> None:
         # pylint: disable=protected-access
         systemctl_mqtt._dbus.login_manager.lock_all_sessions()
@@ -255,6 +313,8 @@ class _MQTTActionLockAllSessions(_MQTTAction):
 
 class _MQTTActionSuspend(_MQTTAction):
     # pylint: disable=too-few-public-methods
+    __slots__ = ()
+
     def trigger(self, state: _State) -> None:
         # pylint: disable=protected-access
         systemctl_mqtt._dbus.login_manager.suspend()
@@ -268,20 +328,21 @@ _MQTT_TOPIC_SUFFIX_ACTION_MAPPING = {
 
 
 async def _mqtt_message_loop(*, state: _State, mqtt_client: aiomqtt.Client) -> None:
-    action_by_topic: typing.Dict[str, _MQTTAction] = {}
-    for topic_suffix, action in _MQTT_TOPIC_SUFFIX_ACTION_MAPPING.items():
-        topic = state.mqtt_topic_prefix + "/" + topic_suffix
-        _LOGGER.info("subscribing to %s", topic)
-        await mqtt_client.subscribe(topic)
-        action_by_topic[topic] = action
+    action_by_topic = state.mqtt_action_by_topic
+    _LOGGER.info("subscribing to %s", ", ".join(action_by_topic.keys()))
+    # single SUBSCRIBE packet
+    await mqtt_client.subscribe([(topic, 0) for topic in action_by_topic.keys()])
     async for message in mqtt_client.messages:
+        topic = message.topic.value
         if message.retain:
-            _LOGGER.info("ignoring retained message on topic %r", message.topic.value)
+            _LOGGER.info("ignoring retained message on topic %r", topic)
+            continue
+        _LOGGER.debug("received message on topic %r: %r", topic, message.payload)
+        action = action_by_topic.get(topic)
+        if action is None:
+            _LOGGER.warning("ignoring message on unexpected topic %r", topic)
         else:
-            _LOGGER.debug(
-                "received message on topic %r: %r", message.topic.value, message.payload
-            )
-            action_by_topic[message.topic.value].trigger(state=state)
+            action.trigger(state=state)
 
 
 async def _dbus_signal_loop_preparing_for_shutdown(
@@ -298,7 +359,21 @@ async def _dbus_signal_loop_preparing_for_shutdown(
         )
     )
     assert await bus_proxy.AddMatch(preparing_for_shutdown_match_rule) == ()
-    with dbus_router.filter(preparing_for_shutdown_match_rule) as queue:
+    # > :param int bufsize: If no queue is passed in, create one with this size
+    # jeepney silently drops messages when the queue is full,
+    # e.g. while awaiting a publish to a congested mqtt broker.
+    with dbus_router.filter(
+        preparing_for_shutdown_match_rule, queue=asyncio.Queue()  # unbounded
+    ) as queue:
+        # after registering filter to avoid missing changes
+        await state.publish_preparing_for_shutdown(
+            mqtt_client=mqtt_client,
+            login_manager=jeepney.io.asyncio.Proxy(
+                # pylint: disable=protected-access
+                msggen=systemctl_mqtt._dbus.login_manager.LoginManager(),
+                router=dbus_router,
+            ),
+        )
         while True:
             message: jeepney.low_level.Message = await queue.get()
             (preparing_for_shutdown,) = message.body
@@ -315,27 +390,14 @@ async def _get_unit_path(
     return path
 
 
-async def _dbus_signal_loop_unit(  # pylint: disable=too-many-arguments
+async def _dbus_signal_loop_units(  # pylint: disable=too-many-locals
     *,
     state: _State,
     mqtt_client: aiomqtt.Client,
     dbus_router: jeepney.io.asyncio.DBusRouter,
     bus_proxy: jeepney.io.asyncio.Proxy,
-    unit_name: str,
-    unit_path: str,
+    unit_names_by_path: typing.Dict[str, typing.List[str]],
 ) -> None:
-    unit_proxy = jeepney.io.asyncio.Proxy(
-        # pylint: disable=protected-access
-        msggen=systemctl_mqtt._dbus.service_manager.Unit(object_path=unit_path),
-        router=dbus_router,
-    )
-    unit_properties_changed_match_rule = jeepney.MatchRule(
-        type="signal",
-        interface="org.freedesktop.DBus.Properties",
-        member="PropertiesChanged",
-        path=unit_path,
-    )
-    assert (await bus_proxy.AddMatch(unit_properties_changed_match_rule)) == ()
     # > Table 1. Unit ACTIVE states …
     # > active	Started, bound, plugged in, …
     # > inactive	Stopped, unbound, unplugged, …
@@ -348,22 +410,93 @@ async def _dbus_signal_loop_unit(  # pylint: disable=too-many-arguments
     # > refreshing	Unit is active and a new mount is being activated in its
     # .             namespace.
     # https://web.archive.org/web/20250101121304/https://www.freedesktop.org/software/systemd/man/latest/org.freedesktop.systemd1.html
-    active_state_topic = state.get_system_unit_active_state_mqtt_topic(
-        unit_name=unit_name
+    for unit_path in unit_names_by_path.keys():
+        unit_properties_changed_match_rule = jeepney.MatchRule(
+            type="signal",
+            interface="org.freedesktop.DBus.Properties",
+            member="PropertiesChanged",
+            path=unit_path,
+        )
+        # > PropertiesChanged (STRING interface_name, …)
+        # skip changes of org.freedesktop.systemd1.Service & co.
+        unit_properties_changed_match_rule.add_arg_condition(
+            0, "org.freedesktop.systemd1.Unit"
+        )
+        # one match rule per unit to avoid receiving signals of all units
+        assert (await bus_proxy.AddMatch(unit_properties_changed_match_rule)) == ()
+    unit_proxy_by_path = {
+        unit_path: jeepney.io.asyncio.Proxy(
+            # pylint: disable=protected-access
+            msggen=systemctl_mqtt._dbus.service_manager.Unit(object_path=unit_path),
+            router=dbus_router,
+        )
+        for unit_path in unit_names_by_path.keys()
+    }
+    # aliases (e.g. ssh.service & sshd.service) share the same object path
+    active_state_topics_by_path = {
+        unit_path: [
+            state.get_system_unit_active_state_mqtt_topic(unit_name=unit_name)
+            for unit_name in unit_names
+        ]
+        for unit_path, unit_names in unit_names_by_path.items()
+    }
+    last_active_state_by_path: typing.Dict[str, str] = {}
+
+    async def _publish_active_state(*, unit_path: str, active_state: str) -> None:
+        for active_state_topic in active_state_topics_by_path[unit_path]:
+            await mqtt_client.publish(topic=active_state_topic, payload=active_state)
+        last_active_state_by_path[unit_path] = active_state
+
+    async def _publish_initial_active_state(unit_path: str) -> None:
+        ((_, active_state),) = await unit_proxy_by_path[unit_path].Get(
+            property_name="ActiveState"
+        )
+        await _publish_active_state(unit_path=unit_path, active_state=active_state)
+
+    # single router filter for all units, dispatching by object path
+    units_properties_changed_filter_rule = jeepney.MatchRule(
+        type="signal",
+        interface="org.freedesktop.DBus.Properties",
+        member="PropertiesChanged",
+        path_namespace="/org/freedesktop/systemd1/unit",
     )
-    ((_, last_active_state),) = await unit_proxy.Get(property_name="ActiveState")
-    await mqtt_client.publish(topic=active_state_topic, payload=last_active_state)
-    with dbus_router.filter(unit_properties_changed_match_rule) as queue:
-        while True:
-            await queue.get()
-            ((_, current_active_state),) = await unit_proxy.Get(
-                property_name="ActiveState"
+    units_properties_changed_filter_rule.add_arg_condition(
+        0, "org.freedesktop.systemd1.Unit"
+    )
+    with dbus_router.filter(
+        units_properties_changed_filter_rule, queue=asyncio.Queue()  # unbounded
+    ) as queue:
+        # after registering filter to avoid missing changes
+        await asyncio.gather(
+            *(
+                _publish_initial_active_state(unit_path)
+                for unit_path in unit_names_by_path.keys()
             )
-            if current_active_state != last_active_state:
-                await mqtt_client.publish(
-                    topic=active_state_topic, payload=current_active_state
+        )
+        while True:
+            message: jeepney.low_level.Message = await queue.get()
+            unit_path = message.header.fields[jeepney.low_level.HeaderFields.path]
+            if unit_path not in unit_proxy_by_path:  # unit not monitored
+                queue.task_done()
+                continue
+            # > PropertiesChanged (STRING interface_name,
+            # >                    DICT<STRING,VARIANT> changed_properties,
+            # >                    ARRAY<STRING> invalidated_properties);
+            # https://dbus.freedesktop.org/doc/dbus-specification.html#standard-interfaces-properties
+            _, changed_properties, invalidated_properties = message.body
+            if "ActiveState" in changed_properties:
+                _, current_active_state = changed_properties["ActiveState"]
+            elif "ActiveState" in invalidated_properties:
+                ((_, current_active_state),) = await unit_proxy_by_path[unit_path].Get(
+                    property_name="ActiveState"
+                )
+            else:
+                queue.task_done()
+                continue
+            if current_active_state != last_active_state_by_path[unit_path]:
+                await _publish_active_state(
+                    unit_path=unit_path, active_state=current_active_state
                 )
-                last_active_state = current_active_state
             queue.task_done()
 
 
@@ -378,32 +511,45 @@ async def _dbus_signal_loop(*, state: _State, mqtt_client: aiomqtt.Client) -> No
             msggen=systemctl_mqtt._dbus.service_manager.ServiceManager(),
             router=router,
         )
-        await asyncio.gather(
-            *[
-                _dbus_signal_loop_preparing_for_shutdown(
-                    state=state,
-                    mqtt_client=mqtt_client,
-                    dbus_router=router,
-                    bus_proxy=bus_proxy,
-                )
-            ]
-            + [
-                _dbus_signal_loop_unit(
-                    state=state,
-                    mqtt_client=mqtt_client,
-                    dbus_router=router,
-                    bus_proxy=bus_proxy,
-                    unit_name=unit_name,
-                    unit_path=await _get_unit_path(
-                        service_manager=system_service_manager, unit_name=unit_name
-                    ),
+        # concurrent GetUnit method calls
+        unit_paths = await asyncio.gather(
+            *(
+                _get_unit_path(
+                    service_manager=system_service_manager, unit_name=unit_name
                 )
                 for unit_name in state.monitored_system_unit_names
-            ],
+            )
+        )
+        unit_names_by_path: typing.Dict[str, typing.List[str]] = {}
+        for unit_path, unit_name in zip(unit_paths, state.monitored_system_unit_names):
+            unit_names_by_path.setdefault(unit_path, []).append(unit_name)
+        await asyncio.gather(
+            _dbus_signal_loop_preparing_for_shutdown(
+                state=state,
+                mqtt_client=mqtt_client,
+                dbus_router=router,
+                bus_proxy=bus_proxy,
+            ),
+            _dbus_signal_loop_units(
+                state=state,
+                mqtt_client=mqtt_client,
+                dbus_router=router,
+                bus_proxy=bus_proxy,
+                unit_names_by_path=unit_names_by_path,
+            ),
             return_exceptions=False,
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _get_default_tls_context() -> ssl.SSLContext:
+    # loads system's ca certificates
+    # > The settings [...] usually represent a higher security level than
+    # > when calling the SSLContext constructor directly.
+    # https://web.archive.org/web/20230714183106/https://docs.python.org/3/library/ssl.html
+    return ssl.create_default_context()
+
+
 async def _run(  # pylint: disable=too-many-arguments
     *,
     mqtt_host: str,
@@ -435,10 +581,7 @@ async def _run(  # pylint: disable=too-many-arguments
     async with aiomqtt.Client(  # raises aiomqtt.MqttError
         hostname=mqtt_host,
         port=mqtt_port,
-        # > The settings [...] usually represent a higher security level than
-        # > when calling the SSLContext constructor directly.
-        # https://web.archive.org/web/20230714183106/https://docs.python.org/3/library/ssl.html
-        tls_context=None if mqtt_disable_tls else ssl.create_default_context(),
+        tls_context=None if mqtt_disable_tls else _get_default_tls_context(),
         username=None if mqtt_username is None else mqtt_username,
         password=None if mqtt_password is None else mqtt_password,
         will=aiomqtt.Will(  # e.g. on SIGTERM & SIGKILL
@@ -446,12 +589,13 @@ async def _run(  # pylint: disable=too-many-arguments
             payload=_MQTT_PAYLOAD_NOT_AVAILABLE,
             retain=True,
         ),
+        # disable nagle's algorithm to avoid delaying small packets
+        socket_options=((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),),
     ) as mqtt_client:
         _LOGGER.debug("connected to MQTT broker %s:%d", mqtt_host, mqtt_port)
         if not state.shutdown_lock_acquired:
             state.acquire_shutdown_lock()
         await state.publish_homeassistant_device_config(mqtt_client=mqtt_client)
-        await state.publish_preparing_for_shutdown(mqtt_client=mqtt_client)
         try:
             await mqtt_client.publish(
                 topic=state.mqtt_availability_topic,
@@ -509,7 +653,7 @@ def _main() -> None:
         "--mqtt-topic-prefix",
         type=str,
         # pylint: disable=protected-access
-        default="systemctl/" + systemctl_mqtt._utils.get_hostname(),
+        default=f"systemctl/{systemctl_mqtt._utils.get_hostname()}",
         help="default: %(default)s",
     )
     # https://www.home-assistant.io/docs/mqtt/discovery/#discovery_prefix
@@ -517,7 +661,7 @@ def _main() -> None:
         "--homeassistant-discovery-prefix",
         type=str,
         default="homeassistant",
-        help="home assistant's prefix for discovery topics" + " (default: %(default)s)",
+        help="home assistant's prefix for discovery topics (default: %(default)s)",
     )
     argparser.add_argument(
         "--homeassistant-discovery-object-id",
@@ -548,10 +692,8 @@ def _main() -> None:
     if args.mqtt_password_path:
         # .read_text() replaces \r\n with \n
         mqtt_password = args.mqtt_password_path.read_bytes().decode()
-        if mqtt_password.endswith("\r\n"):
-            mqtt_password = mqtt_password[:-2]
-        elif mqtt_password.endswith("\n"):
-            mqtt_password = mqtt_password[:-1]
+        if mqtt_password.endswith("\n"):  # strip single trailing \n or \r\n
+            mqtt_password = mqtt_password[:-1].removesuffix("\r")
     else:
         mqtt_password = args.mqtt_password
     # pylint: disable=protected-access
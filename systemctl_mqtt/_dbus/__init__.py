@@ -29,15 +29,20 @@ class Properties(jeepney.MessageGenerator):
 
     interface = "org.freedesktop.DBus.Properties"  # overwritten
 
+    def __init__(self, *, object_path: str, bus_name: str):
+        super().__init__(object_path=object_path, bus_name=bus_name)
+        # reused for all property reads of the object
+        self._properties_address = jeepney.DBusAddress(
+            object_path=object_path,
+            bus_name=bus_name,
+            interface="org.freedesktop.DBus.Properties",
+        )
+
     # pylint: disable=invalid-name
 
     def Get(self, property_name: str) -> jeepney.low_level.Message:
         return jeepney.new_method_call(
-            remote_obj=jeepney.DBusAddress(
-                object_path=self.object_path,
-                bus_name=self.bus_name,
-                interface="org.freedesktop.DBus.Properties",
-            ),
+            remote_obj=self._properties_address,
             method="Get",
             signature="ss",
             body=(self.interface, property_name),
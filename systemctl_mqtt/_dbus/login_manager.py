@@ -16,6 +16,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import datetime
+import functools
 import getpass
 import json
 import logging
@@ -30,9 +31,17 @@ _LOGGER = logging.getLogger(__name__)
 
 _LOGIN_MANAGER_OBJECT_PATH = "/org/freedesktop/login1"
 _LOGIN_MANAGER_INTERFACE = "org.freedesktop.login1.Manager"
+# $ pkaction | grep login1
+_SCHEDULE_SHUTDOWN_POLKIT_ACTION_IDS = {
+    "poweroff": "org.freedesktop.login1.power-off",
+    "reboot": "org.freedesktop.login1.reboot",
+}
 
 
+@functools.lru_cache(maxsize=1)
 def _get_username() -> typing.Optional[str]:
+    # uid does not change during runtime.
+    # pwd.getpwuid may query remote directories (e.g. nss_ldap, sssd).
     try:
         return getpass.getuser()
     except OSError:
@@ -111,7 +120,13 @@ class LoginManager(systemctl_mqtt._dbus.Properties):  # pylint: disable=protecte
             remote_obj=self,
             method="ScheduleShutdown",
             signature="st",
-            body=(action, int(time.timestamp() * 1e6)),  # (type, usec)
+            body=(
+                action,
+                # usec; integer arithmetic avoids float rounding errors
+                # e.g. int(2004-05-16T23:44:05.310284Z.timestamp() * 1e6)
+                #      = 1084751045310283
+                int(time.replace(microsecond=0).timestamp()) * 10**6 + time.microsecond,
+            ),
         )
 
     def Suspend(self, *, interactive: bool) -> jeepney.low_level.Message:
@@ -130,7 +145,11 @@ class LoginManager(systemctl_mqtt._dbus.Properties):  # pylint: disable=protecte
         )
 
 
+@functools.lru_cache(maxsize=1)
 def get_login_manager_proxy() -> jeepney.io.blocking.Proxy:
+    # single connection shared by shutdown inhibitor lock & all actions
+    # to avoid connecting & authenticating to the bus on every action.
+    # only used from the event loop's thread.
     # https://jeepney.readthedocs.io/en/latest/integrate.html
     # https://gitlab.com/takluyver/jeepney/-/blob/master/examples/aio_notify.py
     return jeepney.io.blocking.Proxy(
@@ -171,11 +190,12 @@ def _log_shutdown_inhibitors(login_manager_proxy: jeepney.io.blocking.Proxy) ->
 
 def schedule_shutdown(*, action: str, delay: datetime.timedelta) -> None:
     # https://github.com/systemd/systemd/blob/v237/src/systemctl/systemctl.c#L8553
-    assert action in ["poweroff", "reboot"], action
+    if action not in _SCHEDULE_SHUTDOWN_POLKIT_ACTION_IDS:
+        raise ValueError(f"unsupported shutdown action {action!r}")
     time = datetime.datetime.now() + delay
-    # datetime.datetime.isoformat(timespec=) not available in python3.5
-    # https://github.com/python/cpython/blob/v3.5.9/Lib/datetime.py#L1552
-    _LOGGER.info("scheduling %s for %s", action, time.strftime("%Y-%m-%d %H:%M:%S"))
+    _LOGGER.info(
+        "scheduling %s for %s", action, time.isoformat(sep=" ", timespec="seconds")
+    )
     login_manager = get_login_manager_proxy()
     try:
         # $ gdbus introspect --system --dest org.freedesktop.login1 \
@@ -195,8 +215,7 @@ def schedule_shutdown(*, action: str, delay: datetime.timedelta) -> None:
         if exc.name == "org.freedesktop.DBus.Error.InteractiveAuthorizationRequired":
             _log_interactive_authorization_required(
                 action_label="schedule " + action,
-                action_id="org.freedesktop.login1."
-                + {"poweroff": "power-off"}.get(action, action),
+                action_id=_SCHEDULE_SHUTDOWN_POLKIT_ACTION_IDS[action],
             )
         else:
             _LOGGER.error("failed to schedule %s: %s", action, exc)
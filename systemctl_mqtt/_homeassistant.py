@@ -20,11 +20,12 @@ import re
 import systemctl_mqtt._utils
 
 NODE_ID_ALLOWED_CHARS = r"a-zA-Z0-9_-"
+_NODE_ID_DISALLOWED_CHARS_PATTERN = re.compile(f"[^{NODE_ID_ALLOWED_CHARS}]")
+_NODE_ID_PATTERN = re.compile(f"^[{NODE_ID_ALLOWED_CHARS}]+$")
 
 
 def get_default_discovery_object_id() -> str:
-    return re.sub(
-        f"[^{NODE_ID_ALLOWED_CHARS}]",
+    return _NODE_ID_DISALLOWED_CHARS_PATTERN.sub(
         "",
         # pylint: disable=protected-access
         "systemctl-mqtt-" + systemctl_mqtt._utils.get_hostname(),
@@ -32,4 +33,4 @@ def get_default_discovery_object_id() -> str:
 
 
 def validate_discovery_object_id(object_id: str) -> bool:
-    return re.match(f"^[{NODE_ID_ALLOWED_CHARS}]+$", object_id) is not None
+    return _NODE_ID_PATTERN.match(object_id) is not None
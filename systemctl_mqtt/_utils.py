@@ -15,8 +15,12 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import functools
 import socket
 
 
+@functools.lru_cache(maxsize=1)
 def get_hostname() -> str:
+    # cached to consistently use the same hostname for default mqtt topic
+    # prefix, discovery object id & device config throughout runtime
     return socket.gethostname()
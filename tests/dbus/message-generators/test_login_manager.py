@@ -30,8 +30,13 @@ import systemctl_mqtt._dbus.login_manager
 
 @contextlib.contextmanager
 def mock_open_dbus_connection() -> typing.Iterator[unittest.mock.MagicMock]:
-    with unittest.mock.patch("jeepney.io.blocking.open_dbus_connection") as mock:
-        yield mock.return_value
+    systemctl_mqtt._dbus.login_manager.get_login_manager_proxy.cache_clear()
+    try:
+        with unittest.mock.patch("jeepney.io.blocking.open_dbus_connection") as mock:
+            yield mock.return_value
+    finally:
+        # do not leak proxy wrapping mocked connection into other tests
+        systemctl_mqtt._dbus.login_manager.get_login_manager_proxy.cache_clear()
 
 
 @pytest.mark.parametrize(
@@ -51,6 +56,17 @@ def mock_open_dbus_connection() -> typing.Iterator[unittest.mock.MagicMock]:
             },
             ("poweroff", 0),
         ),
+        (
+            "ScheduleShutdown",
+            "st",
+            {
+                "action": "reboot",
+                "time": datetime.datetime(
+                    2004, 5, 16, 23, 44, 5, 310284, tzinfo=datetime.timezone.utc
+                ),
+            },
+            ("reboot", 1084751045310284),
+        ),
         ("Suspend", "b", {"interactive": True}, (True,)),
         (
             "Inhibit",
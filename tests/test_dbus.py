@@ -33,13 +33,28 @@ import systemctl_mqtt._dbus.login_manager
 
 
 def test_get_login_manager_proxy():
+    systemctl_mqtt._dbus.login_manager.get_login_manager_proxy.cache_clear()
     login_manager = systemctl_mqtt._dbus.login_manager.get_login_manager_proxy()
     assert isinstance(login_manager, jeepney.io.blocking.Proxy)
+    assert systemctl_mqtt._dbus.login_manager.get_login_manager_proxy() is login_manager
     assert login_manager._msggen.interface == "org.freedesktop.login1.Manager"
     # https://freedesktop.org/wiki/Software/systemd/logind/
     assert login_manager.CanPowerOff() in {("yes",), ("challenge",)}
 
 
+def test_get_login_manager_proxy_cached() -> None:
+    with unittest.mock.patch(
+        "jeepney.io.blocking.open_dbus_connection"
+    ) as open_dbus_connection_mock:
+        systemctl_mqtt._dbus.login_manager.get_login_manager_proxy.cache_clear()
+        try:
+            proxy = systemctl_mqtt._dbus.login_manager.get_login_manager_proxy()
+            assert systemctl_mqtt._dbus.login_manager.get_login_manager_proxy() is proxy
+        finally:
+            systemctl_mqtt._dbus.login_manager.get_login_manager_proxy.cache_clear()
+    open_dbus_connection_mock.assert_called_once_with(bus="SYSTEM", enable_fds=True)
+
+
 def test__log_shutdown_inhibitors_some(caplog):
     login_manager = unittest.mock.MagicMock()
     login_manager.ListInhibitors.return_value = (
@@ -91,23 +106,39 @@ def test__log_shutdown_inhibitors_fail(caplog):
 
 @pytest.mark.parametrize("action", ["poweroff", "reboot"])
 @pytest.mark.parametrize("delay", [datetime.timedelta(0), datetime.timedelta(hours=1)])
-def test__schedule_shutdown(action, delay):
+def test__schedule_shutdown(action, delay, caplog):
     login_manager_mock = unittest.mock.MagicMock()
     with unittest.mock.patch(
         "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy",
         return_value=login_manager_mock,
-    ):
+    ), caplog.at_level(logging.INFO):
         login_manager_mock.ListInhibitors.return_value = ([],)
         systemctl_mqtt._dbus.login_manager.schedule_shutdown(action=action, delay=delay)
     login_manager_mock.ScheduleShutdown.assert_called_once()
     schedule_args, schedule_kwargs = login_manager_mock.ScheduleShutdown.call_args
     assert not schedule_args
     assert schedule_kwargs.pop("action") == action
-    actual_delay = schedule_kwargs.pop("time") - datetime.datetime.now()
+    schedule_time = schedule_kwargs.pop("time")
+    assert caplog.records[0].message == (
+        f"scheduling {action} for {schedule_time:%Y-%m-%d %H:%M:%S}"
+    )
+    actual_delay = schedule_time - datetime.datetime.now()
     assert actual_delay.total_seconds() == pytest.approx(delay.total_seconds(), abs=0.1)
     assert not schedule_kwargs
 
 
+def test__schedule_shutdown_invalid_action():
+    with unittest.mock.patch(
+        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy"
+    ) as get_login_manager_mock, pytest.raises(
+        ValueError, match=r"^unsupported shutdown action 'halt'$"
+    ):
+        systemctl_mqtt._dbus.login_manager.schedule_shutdown(
+            action="halt", delay=datetime.timedelta()
+        )
+    get_login_manager_mock.assert_not_called()
+
+
 class DBusErrorResponseMock(jeepney.wrappers.DBusErrorResponse):
     # pylint: disable=missing-class-docstring,super-init-not-called
     def __init__(self, name: str, data: typing.Any):
@@ -211,23 +242,43 @@ def test__schedule_shutdown_fail_no_username(
         data=(error_message,),
     )
     login_manager_mock.ListInhibitors.return_value = ([],)
-    with unittest.mock.patch(
-        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy",
-        return_value=login_manager_mock,
-    ), unittest.mock.patch(
-        "getpass.getuser", side_effect=OSError("No username set in the environment")
-    ), caplog.at_level(
-        logging.ERROR
-    ):
-        systemctl_mqtt._dbus.login_manager.schedule_shutdown(
-            action=action, delay=datetime.timedelta(seconds=21)
-        )
+    systemctl_mqtt._dbus.login_manager._get_username.cache_clear()
+    try:
+        with unittest.mock.patch(
+            "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy",
+            return_value=login_manager_mock,
+        ), unittest.mock.patch(
+            "getpass.getuser",
+            side_effect=OSError("No username set in the environment"),
+        ), caplog.at_level(
+            logging.ERROR
+        ):
+            systemctl_mqtt._dbus.login_manager.schedule_shutdown(
+                action=action, delay=datetime.timedelta(seconds=21)
+            )
+    finally:
+        # do not leak cached None into other tests
+        systemctl_mqtt._dbus.login_manager._get_username.cache_clear()
     login_manager_mock.ScheduleShutdown.assert_called_once()
     assert len(caplog.records) == 1
     assert caplog.records[0].levelno == logging.ERROR
     assert caplog.records[0].message == f"failed to schedule {action}: {log_message}"
 
 
+@pytest.mark.parametrize("username", ["me", "someone"])
+def test__get_username(username: str) -> None:
+    systemctl_mqtt._dbus.login_manager._get_username.cache_clear()
+    try:
+        with unittest.mock.patch(
+            "getpass.getuser", return_value=username
+        ) as getuser_mock:
+            assert systemctl_mqtt._dbus.login_manager._get_username() == username
+            assert systemctl_mqtt._dbus.login_manager._get_username() == username
+    finally:
+        systemctl_mqtt._dbus.login_manager._get_username.cache_clear()
+    getuser_mock.assert_called_once_with()
+
+
 def test_suspend(caplog):
     login_manager_mock = unittest.mock.MagicMock()
     with unittest.mock.patch(
@@ -318,8 +369,8 @@ async def test__dbus_signal_loop(monitored_system_unit_names: typing.List[str])
     ) as open_dbus_router_mock, unittest.mock.patch(
         "systemctl_mqtt._get_unit_path", _get_unit_path_mock
     ), unittest.mock.patch(
-        "systemctl_mqtt._dbus_signal_loop_unit"
-    ) as dbus_signal_loop_unit_mock:
+        "systemctl_mqtt._dbus_signal_loop_units"
+    ) as dbus_signal_loop_units_mock:
         async with open_dbus_router_mock() as dbus_router_mock:
             pass
         add_match_reply = unittest.mock.Mock()
@@ -347,7 +398,8 @@ async def test__dbus_signal_loop(monitored_system_unit_names: typing.List[str])
             await asyncio.gather(*(loop_task, _abort_after_msg_queue()))
     assert unittest.mock.call(bus="SYSTEM") in open_dbus_router_mock.call_args_list
     dbus_router_mock.filter.assert_called_once()
-    (filter_match_rule,) = dbus_router_mock.filter.call_args[0]
+    ((filter_match_rule,), filter_kwargs) = dbus_router_mock.filter.call_args
+    assert filter_kwargs["queue"].maxsize == 0  # unbounded
     assert (
         filter_match_rule.header_fields["interface"] == "org.freedesktop.login1.Manager"
     )
@@ -360,16 +412,60 @@ async def test__dbus_signal_loop(monitored_system_unit_names: typing.List[str])
         "interface='org.freedesktop.login1.Manager',member='PrepareForShutdown'"
         ",path='/org/freedesktop/login1',type='signal'",
     )
+    state_mock.publish_preparing_for_shutdown.assert_awaited_once()
+    (
+        publish_preparing_for_shutdown_args,
+        publish_preparing_for_shutdown_kwargs,
+    ) = state_mock.publish_preparing_for_shutdown.await_args
+    assert not publish_preparing_for_shutdown_args
+    login_manager_proxy = publish_preparing_for_shutdown_kwargs.pop("login_manager")
+    assert isinstance(login_manager_proxy, jeepney.io.asyncio.Proxy)
+    assert login_manager_proxy._router == dbus_router_mock
+    assert login_manager_proxy._msggen.interface == "org.freedesktop.login1.Manager"
+    assert set(publish_preparing_for_shutdown_kwargs.keys()) == {"mqtt_client"}
     assert [
         c[1]["active"] for c in state_mock.preparing_for_shutdown_handler.call_args_list
     ] == [False, True, False]
-    assert not any(args for args, _ in dbus_signal_loop_unit_mock.await_args_list)
-    dbus_signal_loop_unit_kwargs = [
-        kwargs for _, kwargs in dbus_signal_loop_unit_mock.await_args_list
-    ]
-    assert [(a["unit_name"], a["unit_path"]) for a in dbus_signal_loop_unit_kwargs] == [
-        (n, f"/org/freedesktop/systemd1/unit/{n}") for n in monitored_system_unit_names
+    ((dbus_signal_loop_units_args, dbus_signal_loop_units_kwargs),) = (
+        dbus_signal_loop_units_mock.await_args_list
+    )
+    assert not dbus_signal_loop_units_args
+    assert dbus_signal_loop_units_kwargs["unit_names_by_path"] == {
+        f"/org/freedesktop/systemd1/unit/{n}": [n] for n in monitored_system_unit_names
+    }
+
+
+async def _get_unit_path_alias_mock(  # pylint: disable=unused-argument
+    *, service_manager: jeepney.io.asyncio.Proxy, unit_name: str
+) -> str:
+    return "/org/freedesktop/systemd1/unit/" + unit_name.replace("sshd.", "ssh.")
+
+
+@pytest.mark.asyncio
+async def test__dbus_signal_loop_unit_alias() -> None:
+    state_mock = unittest.mock.AsyncMock()
+    state_mock.monitored_system_unit_names = [
+        "ssh.service",
+        "foo.service",
+        "sshd.service",
     ]
+    with unittest.mock.patch(
+        "jeepney.io.asyncio.open_dbus_router"
+    ), unittest.mock.patch(
+        "systemctl_mqtt._get_unit_path", _get_unit_path_alias_mock
+    ), unittest.mock.patch(
+        "systemctl_mqtt._dbus_signal_loop_preparing_for_shutdown"
+    ), unittest.mock.patch(
+        "systemctl_mqtt._dbus_signal_loop_units"
+    ) as dbus_signal_loop_units_mock:
+        await systemctl_mqtt._dbus_signal_loop(
+            state=state_mock, mqtt_client=unittest.mock.MagicMock()
+        )
+    ((_, dbus_signal_loop_units_kwargs),) = dbus_signal_loop_units_mock.await_args_list
+    assert dbus_signal_loop_units_kwargs["unit_names_by_path"] == {
+        "/org/freedesktop/systemd1/unit/ssh.service": ["ssh.service", "sshd.service"],
+        "/org/freedesktop/systemd1/unit/foo.service": ["foo.service"],
+    }
 
 
 def _mock_get_active_state_reply(state: str) -> unittest.mock.MagicMock:
@@ -378,8 +474,29 @@ def _mock_get_active_state_reply(state: str) -> unittest.mock.MagicMock:
     return reply_mock
 
 
+def _properties_changed_signal(
+    *,
+    unit_path: str,
+    changed_properties: typing.Dict[str, typing.Tuple[str, str]],
+    invalidated_properties: typing.List[str],
+) -> jeepney.low_level.Message:
+    return jeepney.new_signal(
+        emitter=jeepney.DBusAddress(
+            unit_path, interface="org.freedesktop.DBus.Properties"
+        ),
+        signal="PropertiesChanged",
+        signature="sa{sv}as",
+        body=(
+            "org.freedesktop.systemd1.Unit",
+            changed_properties,
+            invalidated_properties,
+        ),
+    )
+
+
 @pytest.mark.asyncio
-async def test__dbus_signal_loop_unit() -> None:
+async def test__dbus_signal_loop_units() -> None:
+    # pylint: disable=too-many-locals
     state = systemctl_mqtt._State(
         mqtt_topic_prefix="prefix",
         homeassistant_discovery_prefix="unused",
@@ -391,35 +508,57 @@ async def test__dbus_signal_loop_unit() -> None:
     dbus_router_mock = unittest.mock.AsyncMock()
     bus_proxy_mock = unittest.mock.AsyncMock()
     bus_proxy_mock.AddMatch.return_value = ()
-    get_active_state_reply_mock = unittest.mock.MagicMock()
-    get_active_state_reply_mock.body = (("s", "active"),)
-    states = [
-        "active",
-        "deactivating",
-        "inactive",
-        "inactive",
-        "activating",
-        "active",
-        "active",
-        "active",
-        "inactive",
-    ]
-    dbus_router_mock.send_and_get_reply.side_effect = [
-        _mock_get_active_state_reply(s) for s in states
+    get_replies = [
+        _mock_get_active_state_reply(s) for s in ["active", "failed", "inactive"]
     ]
+
+    async def _send_and_get_reply(msg: jeepney.low_level.Message):
+        # reading initial state after registering filter to avoid missing changes
+        dbus_router_mock.filter.assert_called_once()
+        assert msg.header.fields[jeepney.low_level.HeaderFields.member] == "Get"
+        return get_replies.pop(0)
+
+    dbus_router_mock.send_and_get_reply.side_effect = _send_and_get_reply
+    foo_path = "/org/freedesktop/systemd1/unit/foo_2eservice"
+    bar_path = "/org/freedesktop/systemd1/unit/bar_2eservice"
     msg_queue: asyncio.Queue[jeepney.low_level.Message] = asyncio.Queue()
-    for _ in range(len(states) - 1):
-        await msg_queue.put(jeepney.low_level.Message(header=None, body=()))
+    for unit_path, changed_properties, invalidated_properties in [
+        (foo_path, {"ActiveState": ("s", "deactivating")}, []),
+        (foo_path, {"ActiveState": ("s", "inactive")}, []),
+        (foo_path, {"ActiveState": ("s", "inactive")}, []),
+        (foo_path, {"SubState": ("s", "dead")}, []),
+        (bar_path, {"ActiveState": ("s", "failed")}, []),
+        (bar_path, {"ActiveState": ("s", "activating")}, []),
+        (
+            "/org/freedesktop/systemd1/unit/other_2eservice",
+            {"ActiveState": ("s", "active")},
+            [],
+        ),
+        (foo_path, {"ActiveState": ("s", "activating")}, []),
+        (foo_path, {"ActiveState": ("s", "active")}, []),
+        (foo_path, {"ActiveState": ("s", "active")}, []),
+        (foo_path, {}, ["SubState"]),
+        (foo_path, {}, ["ActiveState"]),  # Get
+    ]:
+        await msg_queue.put(
+            _properties_changed_signal(
+                unit_path=unit_path,
+                changed_properties=changed_properties,
+                invalidated_properties=invalidated_properties,
+            )
+        )
     dbus_router_mock.filter = unittest.mock.MagicMock()
     dbus_router_mock.filter.return_value.__enter__.return_value = msg_queue
     loop_task = asyncio.create_task(
-        systemctl_mqtt._dbus_signal_loop_unit(
+        systemctl_mqtt._dbus_signal_loop_units(
             state=state,
             mqtt_client=mqtt_client_mock,
             dbus_router=dbus_router_mock,
             bus_proxy=bus_proxy_mock,
-            unit_name="foo.service",
-            unit_path="/org/freedesktop/systemd1/unit/whatever.service",
+            unit_names_by_path={
+                foo_path: ["foo.service"],
+                bar_path: ["bar.service", "bar-alias.service"],
+            },
         )
     )
 
@@ -429,21 +568,33 @@ async def test__dbus_signal_loop_unit() -> None:
 
     with pytest.raises(asyncio.exceptions.CancelledError):
         await asyncio.gather(*(loop_task, _abort_after_msg_queue()))
-    bus_proxy_mock.AddMatch.assert_awaited_once()
-    ((match_rule,), add_match_kwargs) = bus_proxy_mock.AddMatch.await_args
-    assert match_rule.header_fields["interface"] == "org.freedesktop.DBus.Properties"
-    assert match_rule.header_fields["member"] == "PropertiesChanged"
-    assert not add_match_kwargs
-    assert mqtt_client_mock.publish.await_args_list == [
-        unittest.mock.call(
-            topic="prefix/unit/system/foo.service/active-state", payload=s
+    add_match_rules = [args[0] for args, _ in bus_proxy_mock.AddMatch.await_args_list]
+    assert [r.header_fields["path"] for r in add_match_rules] == [foo_path, bar_path]
+    for match_rule in add_match_rules:
+        assert (
+            match_rule.header_fields["interface"] == "org.freedesktop.DBus.Properties"
         )
-        for s in [  # consecutive duplicates filtered
-            "active",
-            "deactivating",
-            "inactive",
-            "activating",
-            "active",
-            "inactive",
+        assert match_rule.header_fields["member"] == "PropertiesChanged"
+        assert match_rule.arg_conditions == {
+            0: ("org.freedesktop.systemd1.Unit", "string")
+        }
+    dbus_router_mock.filter.assert_called_once()
+    ((filter_rule,), filter_kwargs) = dbus_router_mock.filter.call_args
+    assert filter_rule.path_namespace == "/org/freedesktop/systemd1/unit"
+    assert filter_kwargs["queue"].maxsize == 0  # unbounded
+    assert dbus_router_mock.send_and_get_reply.await_count == 3
+    assert mqtt_client_mock.publish.await_args_list == [
+        unittest.mock.call(topic=f"prefix/unit/system/{n}/active-state", payload=s)
+        for n, s in [  # consecutive duplicates filtered
+            ("foo.service", "active"),
+            ("bar.service", "failed"),
+            ("bar-alias.service", "failed"),
+            ("foo.service", "deactivating"),
+            ("foo.service", "inactive"),
+            ("bar.service", "activating"),
+            ("bar-alias.service", "activating"),
+            ("foo.service", "activating"),
+            ("foo.service", "active"),
+            ("foo.service", "inactive"),
         ]
     ]
@@ -17,6 +17,7 @@
 
 import datetime
 import logging
+import socket
 import ssl
 import unittest.mock
 
@@ -56,7 +57,6 @@ async def test__run(
         "systemctl_mqtt._dbus_signal_loop"
     ) as dbus_signal_loop_mock:
         login_manager_mock.Inhibit.return_value = (jeepney.fds.FileDescriptor(-1),)
-        login_manager_mock.Get.return_value = (("b", False),)
         await systemctl_mqtt._run(
             mqtt_host=mqtt_host,
             mqtt_port=mqtt_port,
@@ -86,6 +86,9 @@ async def test__run(
         retain=True,
         properties=None,
     )
+    assert mqtt_client_init_kwargs.pop("socket_options") == (
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    )
     assert not mqtt_client_init_kwargs
     login_manager_mock.Inhibit.assert_called_once_with(
         what="shutdown",
@@ -93,33 +96,31 @@ async def test__run(
         why="Report shutdown via MQTT",
         mode="delay",
     )
-    login_manager_mock.Get.assert_called_once_with("PreparingForShutdown")
+    login_manager_mock.Get.assert_not_called()  # via async router in signal loop
     async with mqtt_client_class_mock() as mqtt_client_mock:
         pass
-    assert mqtt_client_mock.publish.call_count == 4
+    assert mqtt_client_mock.publish.call_count == 3
     assert (
         mqtt_client_mock.publish.call_args_list[0][1]["topic"]
         == f"{homeassistant_discovery_prefix}/device/{homeassistant_discovery_object_id}/config"
     )
-    assert mqtt_client_mock.publish.call_args_list[1] == unittest.mock.call(
-        topic=mqtt_topic_prefix + "/preparing-for-shutdown",
-        payload="false",
-        retain=False,
-    )
-    assert mqtt_client_mock.publish.call_args_list[2][1] == {
+    assert mqtt_client_mock.publish.call_args_list[1][1] == {
         "topic": mqtt_topic_prefix + "/status",
         "payload": "online",
         "retain": True,
     }
-    assert mqtt_client_mock.publish.call_args_list[3][1] == {
+    assert mqtt_client_mock.publish.call_args_list[2][1] == {
         "topic": mqtt_topic_prefix + "/status",
         "payload": "offline",
         "retain": True,
     }
-    assert sorted(mqtt_client_mock.subscribe.call_args_list) == [
-        unittest.mock.call(mqtt_topic_prefix + "/lock-all-sessions"),
-        unittest.mock.call(mqtt_topic_prefix + "/poweroff"),
-        unittest.mock.call(mqtt_topic_prefix + "/suspend"),
+    mqtt_client_mock.subscribe.assert_called_once()
+    ((subscriptions,), subscribe_kwargs) = mqtt_client_mock.subscribe.call_args
+    assert not subscribe_kwargs
+    assert sorted(subscriptions) == [
+        (mqtt_topic_prefix + "/lock-all-sessions", 0),
+        (mqtt_topic_prefix + "/poweroff", 0),
+        (mqtt_topic_prefix + "/suspend", 0),
     ]
     assert caplog.records[1].levelno == logging.DEBUG
     assert (
@@ -136,16 +137,11 @@ async def test__run(
         + homeassistant_discovery_object_id
         + "/config"
     )
+    assert len(caplog.records) == 5
     assert caplog.records[4].levelno == logging.INFO
-    assert (
-        caplog.records[4].message
-        == f"publishing 'false' on {mqtt_topic_prefix}/preparing-for-shutdown"
+    assert caplog.records[4].message == "subscribing to " + ", ".join(
+        f"{mqtt_topic_prefix}/{s}" for s in ("poweroff", "lock-all-sessions", "suspend")
     )
-    assert all(r.levelno == logging.INFO for r in caplog.records[5::2])
-    assert {r.message for r in caplog.records[5:]} == {
-        f"subscribing to {mqtt_topic_prefix}/{s}"
-        for s in ("poweroff", "lock-all-sessions", "suspend")
-    }
     dbus_signal_loop_mock.assert_awaited_once()
 
 
@@ -180,7 +176,12 @@ async def test__run_tls(caplog, mqtt_host, mqtt_port, mqtt_disable_tls):
         assert mqtt_client_init_kwargs.pop("tls_context") is None
     else:
         assert isinstance(mqtt_client_init_kwargs.pop("tls_context"), ssl.SSLContext)
-    assert set(mqtt_client_init_kwargs.keys()) == {"username", "password", "will"}
+    assert set(mqtt_client_init_kwargs.keys()) == {
+        "username",
+        "password",
+        "will",
+        "socket_options",
+    }
     assert caplog.records[0].levelno == logging.INFO
     assert caplog.records[0].message == (
         f"connecting to MQTT broker {mqtt_host}:{mqtt_port}"
@@ -216,6 +217,12 @@ async def test__run_tls_default():
     dbus_signal_loop_mock.assert_awaited_once()
 
 
+def test__get_default_tls_context() -> None:
+    tls_context = systemctl_mqtt._get_default_tls_context()
+    assert isinstance(tls_context, ssl.SSLContext)
+    assert systemctl_mqtt._get_default_tls_context() is tls_context
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("mqtt_host", ["mqtt-broker.local"])
 @pytest.mark.parametrize("mqtt_port", [1833])
@@ -289,7 +296,6 @@ async def test__run_sigint(mqtt_topic_prefix: str):
         "asyncio.gather", side_effect=KeyboardInterrupt
     ):
         login_manager_mock.Inhibit.return_value = (jeepney.fds.FileDescriptor(-1),)
-        login_manager_mock.Get.return_value = (("b", False),)
         with pytest.raises(KeyboardInterrupt):
             await systemctl_mqtt._run(
                 mqtt_host="mqtt-broker.local",
@@ -304,17 +310,14 @@ async def test__run_sigint(mqtt_topic_prefix: str):
             )
     async with mqtt_client_class_mock() as mqtt_client_mock:
         pass
-    assert mqtt_client_mock.publish.call_count == 4
+    assert mqtt_client_mock.publish.call_count == 3
     assert mqtt_client_mock.publish.call_args_list[0][1]["topic"].endswith("/config")
-    assert mqtt_client_mock.publish.call_args_list[1][1]["topic"].endswith(
-        "/preparing-for-shutdown"
-    )
-    assert mqtt_client_mock.publish.call_args_list[2][1] == {
+    assert mqtt_client_mock.publish.call_args_list[1][1] == {
         "topic": mqtt_topic_prefix + "/status",
         "payload": "online",
         "retain": True,
     }
-    assert mqtt_client_mock.publish.call_args_list[3][1] == {
+    assert mqtt_client_mock.publish.call_args_list[2][1] == {
         "topic": mqtt_topic_prefix + "/status",
         "payload": "offline",
         "retain": True,
@@ -352,16 +355,19 @@ async def test__mqtt_message_loop_trigger_poweroff(
         await systemctl_mqtt._mqtt_message_loop(
             state=state, mqtt_client=mqtt_client_mock
         )
-    assert sorted(mqtt_client_mock.subscribe.await_args_list) == [
-        unittest.mock.call(mqtt_topic_prefix + "/lock-all-sessions"),
-        unittest.mock.call(mqtt_topic_prefix + "/poweroff"),
-        unittest.mock.call(mqtt_topic_prefix + "/suspend"),
+    mqtt_client_mock.subscribe.assert_awaited_once()
+    ((subscriptions,), subscribe_kwargs) = mqtt_client_mock.subscribe.await_args
+    assert not subscribe_kwargs
+    assert sorted(subscriptions) == [
+        (mqtt_topic_prefix + "/lock-all-sessions", 0),
+        (mqtt_topic_prefix + "/poweroff", 0),
+        (mqtt_topic_prefix + "/suspend", 0),
     ]
     schedule_shutdown_mock.assert_called_once_with(
         action="poweroff", delay=datetime.timedelta(seconds=21)
     )
     assert [
-        t for t in caplog.record_tuples[2:] if not t[2].startswith("subscribing to ")
+        t for t in caplog.record_tuples if not t[2].startswith("subscribing to ")
     ] == [
         (
             "systemctl_mqtt",
@@ -402,7 +408,7 @@ async def test__mqtt_message_loop_retained(
         )
     schedule_shutdown_mock.assert_not_called()
     assert [
-        t for t in caplog.record_tuples[2:] if not t[2].startswith("subscribing to ")
+        t for t in caplog.record_tuples if not t[2].startswith("subscribing to ")
     ] == [
         (
             "systemctl_mqtt",
@@ -412,6 +418,50 @@ async def test__mqtt_message_loop_retained(
     ]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mqtt_topic_prefix", ["systemctl/host"])
+async def test__mqtt_message_loop_unexpected_topic(
+    caplog: pytest.LogCaptureFixture, mqtt_topic_prefix: str
+) -> None:
+    with unittest.mock.patch(
+        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy"
+    ):
+        state = systemctl_mqtt._State(
+            mqtt_topic_prefix=mqtt_topic_prefix,
+            homeassistant_discovery_prefix="homeassistant",
+            homeassistant_discovery_object_id="whatever",
+            poweroff_delay=datetime.timedelta(seconds=21),
+            monitored_system_unit_names=[],
+        )
+    mqtt_client_mock = unittest.mock.AsyncMock()
+    mqtt_client_mock.messages.__aiter__.return_value = [
+        aiomqtt.Message(
+            topic=mqtt_topic_prefix + "/unknown",
+            payload=b"some-payload",
+            qos=0,
+            retain=False,
+            mid=42 // 2,
+            properties=None,
+        )
+    ]
+    with unittest.mock.patch(
+        "systemctl_mqtt._dbus.login_manager.schedule_shutdown"
+    ) as schedule_shutdown_mock, caplog.at_level(logging.INFO):
+        await systemctl_mqtt._mqtt_message_loop(
+            state=state, mqtt_client=mqtt_client_mock
+        )
+    schedule_shutdown_mock.assert_not_called()
+    assert [
+        t for t in caplog.record_tuples if not t[2].startswith("subscribing to ")
+    ] == [
+        (
+            "systemctl_mqtt",
+            logging.WARNING,
+            "ignoring message on unexpected topic 'systemctl/host/unknown'",
+        ),
+    ]
+
+
 @pytest.mark.parametrize("mqtt_topic_prefix", ["systemctl/host", "systemd/raspberrypi"])
 @pytest.mark.parametrize("unit_name", ["foo.service", "bar.service"])
 def test_state_get_system_unit_active_state_mqtt_topic(
@@ -22,6 +22,7 @@ import re
 import typing
 import unittest.mock
 
+import aiomqtt
 import jeepney.wrappers
 import pytest
 
@@ -37,13 +38,14 @@ def test_shutdown_lock():
     ) as get_login_manager_mock:
         state = systemctl_mqtt._State(
             mqtt_topic_prefix="any",
-            homeassistant_discovery_prefix=None,
-            homeassistant_discovery_object_id=None,
+            homeassistant_discovery_prefix="homeassistant",
+            homeassistant_discovery_object_id="node",
             poweroff_delay=datetime.timedelta(),
             monitored_system_unit_names=[],
         )
         get_login_manager_mock.return_value.Inhibit.return_value = (lock_fd,)
         state.acquire_shutdown_lock()
+        state.acquire_shutdown_lock()  # no-op
     state._login_manager.Inhibit.assert_called_once_with(
         what="shutdown",
         who="systemctl-mqtt",
@@ -71,11 +73,11 @@ async def test_preparing_for_shutdown_handler(active: bool) -> None:
         )
     mqtt_client_mock = unittest.mock.MagicMock()
     with unittest.mock.patch.object(
-        state, "_publish_preparing_for_shutdown"
+        systemctl_mqtt._State, "_publish_preparing_for_shutdown"
     ) as publish_mock, unittest.mock.patch.object(
-        state, "acquire_shutdown_lock"
+        systemctl_mqtt._State, "acquire_shutdown_lock"
     ) as acquire_lock_mock, unittest.mock.patch.object(
-        state, "release_shutdown_lock"
+        systemctl_mqtt._State, "release_shutdown_lock"
     ) as release_lock_mock:
         await state.preparing_for_shutdown_handler(
             active=active, mqtt_client=mqtt_client_mock
@@ -89,14 +91,38 @@ async def test_preparing_for_shutdown_handler(active: bool) -> None:
         release_lock_mock.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_preparing_for_shutdown_handler_publish_fail() -> None:
+    with unittest.mock.patch(
+        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy"
+    ):
+        state = systemctl_mqtt._State(
+            mqtt_topic_prefix="any",
+            homeassistant_discovery_prefix="homeassistant",
+            homeassistant_discovery_object_id="node",
+            poweroff_delay=datetime.timedelta(),
+            monitored_system_unit_names=[],
+        )
+    with unittest.mock.patch.object(
+        systemctl_mqtt._State,
+        "_publish_preparing_for_shutdown",
+        side_effect=aiomqtt.MqttError("timeout"),
+    ), unittest.mock.patch.object(
+        systemctl_mqtt._State, "release_shutdown_lock"
+    ) as release_lock_mock, pytest.raises(
+        aiomqtt.MqttError
+    ):
+        await state.preparing_for_shutdown_handler(
+            active=True, mqtt_client=unittest.mock.MagicMock()
+        )
+    release_lock_mock.assert_called_once_with()
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("active", [True, False])
 async def test_publish_preparing_for_shutdown(active: bool) -> None:
-    login_manager_mock = unittest.mock.MagicMock()
-    login_manager_mock.Get.return_value = (("b", active),)[:]
     with unittest.mock.patch(
-        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy",
-        return_value=login_manager_mock,
+        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy"
     ):
         state = systemctl_mqtt._State(
             mqtt_topic_prefix="any",
@@ -105,10 +131,13 @@ async def test_publish_preparing_for_shutdown(active: bool) -> None:
             poweroff_delay=datetime.timedelta(),
             monitored_system_unit_names=[],
         )
-    assert state._login_manager == login_manager_mock
+    login_manager_mock = unittest.mock.AsyncMock()
+    login_manager_mock.Get.return_value = (("b", active),)[:]
     mqtt_client_mock = unittest.mock.AsyncMock()
-    await state.publish_preparing_for_shutdown(mqtt_client=mqtt_client_mock)
-    login_manager_mock.Get.assert_called_once_with("PreparingForShutdown")
+    await state.publish_preparing_for_shutdown(
+        mqtt_client=mqtt_client_mock, login_manager=login_manager_mock
+    )
+    login_manager_mock.Get.assert_awaited_once_with("PreparingForShutdown")
     mqtt_client_mock.publish.assert_awaited_once_with(
         topic="any/preparing-for-shutdown",
         payload="true" if active else "false",
@@ -116,6 +145,31 @@ async def test_publish_preparing_for_shutdown(active: bool) -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test__publish_preparing_for_shutdown_skip_repeated() -> None:
+    with unittest.mock.patch(
+        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy"
+    ):
+        state = systemctl_mqtt._State(
+            mqtt_topic_prefix="any",
+            homeassistant_discovery_prefix="homeassistant",
+            homeassistant_discovery_object_id="node",
+            poweroff_delay=datetime.timedelta(),
+            monitored_system_unit_names=[],
+        )
+    mqtt_client_mock = unittest.mock.AsyncMock()
+    for active in [False, False, True, True, False]:
+        await state._publish_preparing_for_shutdown(
+            mqtt_client=mqtt_client_mock, active=active
+        )
+    assert mqtt_client_mock.publish.await_args_list == [
+        unittest.mock.call(
+            topic="any/preparing-for-shutdown", payload=payload, retain=False
+        )
+        for payload in ["false", "true", "false"]
+    ]
+
+
 class DBusErrorResponseMock(jeepney.wrappers.DBusErrorResponse):
     # pylint: disable=missing-class-docstring,super-init-not-called
     def __init__(self, name: str, data: typing.Any):
@@ -125,21 +179,22 @@ class DBusErrorResponseMock(jeepney.wrappers.DBusErrorResponse):
 
 @pytest.mark.asyncio
 async def test_publish_preparing_for_shutdown_get_fail(caplog):
-    login_manager_mock = unittest.mock.MagicMock()
-    login_manager_mock.Get.side_effect = DBusErrorResponseMock("error", ("mocked",))
     with unittest.mock.patch(
-        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy",
-        return_value=login_manager_mock,
+        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy"
     ):
         state = systemctl_mqtt._State(
             mqtt_topic_prefix="any",
-            homeassistant_discovery_prefix=None,
-            homeassistant_discovery_object_id=None,
+            homeassistant_discovery_prefix="homeassistant",
+            homeassistant_discovery_object_id="node",
             poweroff_delay=datetime.timedelta(),
             monitored_system_unit_names=[],
         )
+    login_manager_mock = unittest.mock.AsyncMock()
+    login_manager_mock.Get.side_effect = DBusErrorResponseMock("error", ("mocked",))
     mqtt_client_mock = unittest.mock.MagicMock()
-    await state.publish_preparing_for_shutdown(mqtt_client=None)
+    await state.publish_preparing_for_shutdown(
+        mqtt_client=mqtt_client_mock, login_manager=login_manager_mock
+    )
     mqtt_client_mock.publish.assert_not_called()
     assert len(caplog.records) == 1
     assert caplog.records[0].levelno == logging.ERROR
@@ -164,7 +219,9 @@ async def test_publish_homeassistant_device_config(
     hostname: str,
     monitored_system_unit_names: typing.List[str],
 ) -> None:
-    with unittest.mock.patch("jeepney.io.blocking.open_dbus_connection"):
+    with unittest.mock.patch(
+        "systemctl_mqtt._dbus.login_manager.get_login_manager_proxy"
+    ), unittest.mock.patch("systemctl_mqtt._utils.get_hostname", return_value=hostname):
         state = systemctl_mqtt._State(
             mqtt_topic_prefix=topic_prefix,
             homeassistant_discovery_prefix=discovery_prefix,
@@ -174,10 +231,7 @@ async def test_publish_homeassistant_device_config(
         )
     assert state.monitored_system_unit_names == monitored_system_unit_names
     mqtt_client = unittest.mock.AsyncMock()
-    with unittest.mock.patch(
-        "systemctl_mqtt._utils.get_hostname", return_value=hostname
-    ):
-        await state.publish_homeassistant_device_config(mqtt_client=mqtt_client)
+    await state.publish_homeassistant_device_config(mqtt_client=mqtt_client)
     mqtt_client.publish.assert_called_once()
     publish_args, publish_kwargs = mqtt_client.publish.call_args
     assert not publish_args
@@ -185,7 +239,12 @@ async def test_publish_homeassistant_device_config(
     assert (
         publish_kwargs["topic"] == discovery_prefix + "/device/" + object_id + "/config"
     )
+    assert isinstance(publish_kwargs["payload"], bytes)
     config = json.loads(publish_kwargs["payload"])
+    # compact, no whitespace after separators
+    assert (
+        json.dumps(config, separators=(",", ":")).encode() == publish_kwargs["payload"]
+    )
     assert re.match(r"\d+\.\d+\.", config["origin"].pop("sw_version"))
     assert config == {
         "origin": {
@@ -24,6 +24,12 @@ import systemctl_mqtt._utils
 
 @pytest.mark.parametrize("hostname", ["test"])
 def test__get_hostname(hostname):
-    with unittest.mock.patch("socket.gethostname", return_value=hostname):
-        # pylint: disable=protected-access
+    # pylint: disable=protected-access
+    systemctl_mqtt._utils.get_hostname.cache_clear()
+    with unittest.mock.patch(
+        "socket.gethostname", return_value=hostname
+    ) as gethostname_mock:
         assert systemctl_mqtt._utils.get_hostname() == hostname
+        assert systemctl_mqtt._utils.get_hostname() == hostname
+    gethostname_mock.assert_called_once_with()
+    systemctl_mqtt._utils.get_hostname.cache_clear()